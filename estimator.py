@@ -1,45 +1,276 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import tkinter.font as tkfont
 import re
+import io
 import datetime
-import openpyxl
+import bisect
+import zipfile
+import string
+from xml.sax.saxutils import escape
 import os
-import shutil
-import glob
+import errno
 import sys
-import pandas as pd
-from dotenv import load_dotenv
-load_dotenv()  # Load environment variables from .env file
+import ctypes
+import csv
+import queue
+import concurrent.futures
+from functools import lru_cache
+
+
+def load_env_file():
+    """ Load KEY=VALUE lines from the nearest .env file into os.environ, keeping variables that are already set """
+    # Like python-dotenv: start next to the script (or the working directory for a PyInstaller exe) and walk up
+    directory = os.getcwd() if getattr(sys, 'frozen', False) else os.path.dirname(os.path.abspath(__file__))
+    while not os.path.isfile(os.path.join(directory, '.env')):
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return
+        directory = parent
+
+    with open(os.path.join(directory, '.env')) as env_file:
+        for line in env_file:
+            line = line.strip()
+            if line.startswith('export '):
+                line = line[len('export '):]
+            if not line or line.startswith('#') or '=' not in line:
+                continue
+            key, value = (part.strip() for part in line.split('=', 1))
+            closing_quote = value.find(value[0], 1) if value[:1] in ('"', "'") else -1
+            if closing_quote != -1:
+                value = value[1:closing_quote]  # Anything after the closing quote (e.g. a comment) is ignored
+            else:
+                value = value.split(' #', 1)[0].rstrip()  # Drop inline comments on unquoted values
+            os.environ.setdefault(key, value)
+
+load_env_file()  # Load environment variables from .env file
+
+# PyInstaller creates a temp folder and stores path in _MEIPASS
+BASE_PATH = getattr(sys, '_MEIPASS', None) or os.path.abspath(os.path.dirname(__file__))
 
+@lru_cache(maxsize=32)
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(os.path.dirname(__file__))
-
     if relative_path is not None:
         relative_path = os.path.normpath(relative_path)  # Normalize the path separators
-        return os.path.join(base_path, relative_path)
+        return os.path.join(BASE_PATH, relative_path)
     else:
         return None  # or handle the case when relative_path is None
 
 
+def financial_year(date):
+    """ Indian financial year (April to March) containing date, e.g. "24-25" """
+    year = date.year - (date.month < 4)
+    return f"{year % 100:02d}-{(year + 1) % 100:02d}"
+
+def next_job_number(job_number):
+    """ Job number issued after job_number, restarting the sequence when the financial year has rolled over """
+    job_year, sequential_number = job_number.split("_")
+    current_financial_year = financial_year(datetime.date.today())
+    if job_year == current_financial_year:
+        return f"{job_year}_{int(sequential_number) + 1:07d}"
+    return f"{current_financial_year}_0000001"
+
+
+COPY_BUFSIZE = 1024 * 1024  # 1 MiB chunks for the portable copy loop
+
+# Errors meaning the copy mechanism is unavailable here rather than a real failure
+# (e.g. access denied); only these fall back to the portable read loop
+_COPY_FILE_RANGE_UNSUPPORTED = (errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL)
+if sys.platform == "win32":
+    _copy_file_w = ctypes.WinDLL("kernel32", use_last_error=True).CopyFileW
+    _copy_file_w.argtypes = (ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_int)
+    _copy_file_w.restype = ctypes.c_int
+    # ERROR_INVALID_FUNCTION, ERROR_NOT_SUPPORTED, ERROR_CALL_NOT_IMPLEMENTED
+    _COPY_FILE_W_UNSUPPORTED = (1, 50, 120)
+
+def _fast_copy(src, dst):
+    """ Copy src to dst with the kernel-side copy available on this platform """
+    if sys.platform == "win32":
+        if _copy_file_w(src, dst, 0):
+            return
+        error = ctypes.get_last_error()
+        if error not in _COPY_FILE_W_UNSUPPORTED:
+            raise ctypes.WinError(error)
+    elif hasattr(os, "copy_file_range"):
+        # Zero-copy on Linux; reflink-capable filesystems share the blocks outright
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), COPY_BUFSIZE):
+                    pass
+            return
+        except OSError as e:
+            if e.errno not in _COPY_FILE_RANGE_UNSUPPORTED:
+                raise
+
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        buffer = bytearray(COPY_BUFSIZE)
+        view = memoryview(buffer)
+        while True:
+            size = fsrc.readinto(buffer)
+            if not size:
+                break
+            fdst.write(view[:size])
+
+
 
 ###DEPENDENCIES
 csv_path = resource_path(os.getenv('RESOURCE_CSV_PATH'))
 if csv_path is not None:
-    df = pd.read_csv(csv_path)
+    cylinders, paper_rolls = [], []
+    with open(csv_path, newline='') as csv_file:
+        reader = csv.reader(csv_file)
+        next(reader, None)  # Skip the header row
+        for row in reader:
+            # Blank or missing cells are skipped, like pandas' dropna()
+            for column, sizes in ((0, cylinders), (1, paper_rolls)):
+                try:
+                    sizes.append(float(row[column]))
+                except (IndexError, ValueError):
+                    pass
 else:
     print("CSV file path is not specified.")
     exit(1)
-AVAILABLE_PAPER_ROLLS = sorted(df.iloc[:, 1].astype(float).dropna().tolist())
-AVAILABLE_CYLINDERS = sorted(df.iloc[:, 0].astype(float).dropna().tolist())
+AVAILABLE_PAPER_ROLLS = tuple(sorted(paper_rolls))
+AVAILABLE_CYLINDERS = tuple(sorted(cylinders))
 save_directory_env = os.getenv('SAVE_DIRECTORY')
 backup_directory_env = os.getenv('BACKUP_DIRECTORY')
 temp_path_env = os.getenv('TEMPLATE_PATH')
 
+# Read the BOM template once; every job is built from this in-memory copy
+template_path = resource_path(temp_path_env)
+if template_path is not None:
+    with open(template_path, 'rb') as template_file:
+        TEMPLATE_BYTES = template_file.read()
+else:
+    print("Template file path is not specified.")
+    exit(1)
+
+_MM_PER_IN = 25.4
+
+if save_directory_env is None:
+    print("Save directory is not specified.")
+    exit(1)
+
+###JOB NUMBER COUNTER
+if backup_directory_env is None:
+    print("Backup directory is not specified.")
+    exit(1)
+# Last issued job number, kept next to the backups so startup does not have to scan them
+_COUNTER_FILE = os.path.join(backup_directory_env, ".counter")
+
+def _read_job_counter():
+    """ Last issued job number from the counter file, or None if it is missing or malformed """
+    try:
+        with open(_COUNTER_FILE) as counter_file:
+            job_number = counter_file.read(32).strip()
+        _, file_number = job_number.split("_")
+    except (OSError, ValueError):
+        return None
+    return job_number if file_number.isdecimal() else None
+
+def _write_job_counter(job_number):
+    """ Record job_number as the last issued one; os.replace makes the update atomic """
+    temp_path = _COUNTER_FILE + ".tmp"
+    with open(temp_path, "w") as counter_file:
+        counter_file.write(job_number)
+    os.replace(temp_path, _COUNTER_FILE)
+
+###VALIDATION
+_EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
+_MOBILE_RE = re.compile(r"^(?:\+91|0)?[789]\d{9}$")
+# (parsed key, entry attribute, minimum, maximum, error message) for each numeric job detail
+_FIELD_LIMITS = (
+    ("width", "width_entry", 5.25, 13.00, "Please enter a valid width value within the range of 5.25 to 13.00."),
+    ("bottom", "bottom_entry", 2.5, 7.00, "Please enter a valid bottom value within the range of 2.5 to 7.00."),
+    ("height", "height_entry", 6.75, 17.75, "Please enter a valid height value within the range of 6.75 to 17.75."),
+    ("gsm", "gsm_entry", 55, 150, "Please enter a valid GSM value within the range of 55 to 150."),
+)
+
+###BOM TEMPLATE
+class BomTemplate:
+    """
+    In-memory copy of the BOM template that writes bills of material without an Excel library.
+
+    Every cell the BOM fills is an empty cell in the template worksheet (<c r="B8" s="30"/>), so the
+    worksheet XML is cached as a string.Template with a placeholder in place of each of those cells.
+    Writing a BOM substitutes the values, so no XML is parsed per job. The remaining parts (styles, logo,
+    page setup) never change, so they are compressed into an archive once; each BOM is a copy of that
+    archive with only the worksheet appended, deflated at level 1.
+
+    Attributes:
+        static_zip (bytes): Zip archive of every template part except the worksheet.
+        sheet (Template): Worksheet XML with a ${ref} placeholder for each fillable cell.
+        styles (dict): Style attribute of each fillable cell, keyed by cell reference.
+    """
+    SHEET_PART = "xl/worksheets/sheet1.xml"
+    _EMPTY_CELL_RE = re.compile(r'<c r="([A-Z]+[0-9]+)"((?: s="[0-9]+")?)/>')
+    # Control characters that are not allowed anywhere in XML 1.0 (same set as openpyxl's ILLEGAL_CHARACTERS_RE)
+    _ILLEGAL_CHARACTERS_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+    def __init__(self, template_bytes, cell_refs):
+        """
+        Split the template into its parts and prepare the worksheet for substitution.
+
+        Args:
+            template_bytes (bytes): Contents of the template xlsx.
+            cell_refs (tuple): References of the cells the BOM fills, e.g. "B8".
+
+        Raises:
+            ValueError: If any of the cells is not an empty cell in the template.
+        """
+        static_zip = io.BytesIO()
+        with zipfile.ZipFile(io.BytesIO(template_bytes)) as template_zip, \
+                zipfile.ZipFile(static_zip, "w", zipfile.ZIP_DEFLATED) as static_parts:
+            for name in template_zip.namelist():
+                if name == self.SHEET_PART:
+                    sheet_xml = template_zip.read(name).decode("utf-8").replace("$", "$$")
+                else:
+                    static_parts.writestr(name, template_zip.read(name))
+        self.static_zip = static_zip.getvalue()
+
+        self.styles = {}
+
+        def placeholder(match):
+            ref, style = match.groups()
+            if ref not in cell_refs:
+                return match.group(0)
+            self.styles[ref] = style
+            return f"${{{ref}}}"
+
+        self.sheet = string.Template(self._EMPTY_CELL_RE.sub(placeholder, sheet_xml))
+
+        missing = sorted(set(cell_refs) - set(self.styles))
+        if missing:
+            raise ValueError(f"Template has no empty cell for {', '.join(missing)}")
+
+    def write(self, path, values):
+        """
+        Save a bill of material built from the template.
+
+        Args:
+            path (str): Destination xlsx path.
+            values (dict): Cell reference to str, int or float; missing or None cells stay empty.
+                Control characters that XML cannot hold (e.g. a vertical tab pasted from Word) are dropped.
+        """
+        cells = {}
+        for ref, style in self.styles.items():
+            value = values.get(ref)
+            if value is None:
+                cells[ref] = f'<c r="{ref}"{style}/>'
+            elif isinstance(value, str):
+                cells[ref] = f'<c r="{ref}"{style} t="inlineStr"><is><t xml:space="preserve">{escape(self._ILLEGAL_CHARACTERS_RE.sub("", value))}</t></is></c>'
+            else:
+                cells[ref] = f'<c r="{ref}"{style}><v>{value!r}</v></c>'
+        sheet_xml = self.sheet.substitute(cells).encode("utf-8")
+
+        bom = io.BytesIO(self.static_zip)
+        with zipfile.ZipFile(bom, "a", zipfile.ZIP_DEFLATED, compresslevel=1) as bom_zip:
+            bom_zip.writestr(self.SHEET_PART, sheet_xml)
+        with open(path, "wb") as bom_file:
+            bom_file.write(bom.getvalue())
+
+
 
 class RawMaterialEstimatorGUI:
     """
@@ -81,12 +312,15 @@ class RawMaterialEstimatorGUI:
 
     Methods:
         __init__(self): Initializes the RawMaterialEstimatorGUI class.
-        generate_job_number(self): Generates a unique job number based on the current date and existing files.
+        generate_job_number(self): Returns the cached job number for the next BOM, computing it on first use.
+        _compute_job_number(self): Generates a unique job number based on the current date and existing files.
         create_widgets(self): Creates and configures the GUI widgets.
         dynamic_fields(self, event): Handles the dynamic creation and removal of color fields based on the printing option.
         validate_fields(self): Validates the input fields to ensure data integrity.
         process_data(self): Processes the validated data and generates the Bill of Material (BOM).
-        handle_fields(self): Resets and updates the GUI fields after processing the data.
+        _write_bom(self, job_number, cells, save_path, backup_path): Saves the BOM and its backup on the worker thread.
+        _poll_queue(self): Handles the outcome of a BOM write on the main thread.
+        handle_fields(self, next_job_no): Resets and updates the GUI fields after processing the data.
         run(self): Runs the GUI application by starting the main event loop.
 
     Note:
@@ -96,6 +330,37 @@ class RawMaterialEstimatorGUI:
     Author: Shubham R
     Date: 17/05/2023
     """
+    # Template cell of each BOM value, in the order process_data lists the values
+    _BOM_CELLS = (
+        "B8", "F8", "J8",                                   # Job number, date, time
+        "B11", "H11", "B12", "B14",                         # Customer name, email, mobile, job type
+        "D15", "F15", "H15", "J15", "L15",                  # Width, bottom, height, GSM, quantity
+        "B16",                                              # Printing
+        "E19", "E20", "E21", "E22", "E23",                  # Calculated values
+        "E24", "E25", "E26", "E27",
+    )
+    _COLOR_CELLS = ("D16", "F16", "H16", "J16", "L16", "N16")
+
+    # Form rows from row 1 down: (label, attribute, factory creating the input widget).
+    # Widgets are created in row order so that Tab moves through the form top to bottom.
+    _FORM = (
+        ("Customer Name:", "customer_name_entry", lambda self: ttk.Entry(self.main_frame, width=45)),
+        ("Customer Email:", "customer_email_entry", lambda self: ttk.Entry(self.main_frame, width=45)),
+        ("Job Name:", "job_name_entry", lambda self: ttk.Entry(self.main_frame, width=45)),
+        ("Customer Mobile:", "customer_mobile_entry", lambda self: ttk.Entry(self.main_frame, width=30)),
+        ("Job Type:", "job_type_combo",
+         lambda self: ttk.Combobox(self.main_frame, values=["SOS", "Carry Bag", "V-Bottom", "Thumb Cut", "Square Cut"],
+                                   font=self._font_body)),
+        ("Width (in):", "width_entry", lambda self: ttk.Entry(self.main_frame, width=30)),
+        ("Bottom (in):", "bottom_entry", lambda self: ttk.Entry(self.main_frame, width=30)),
+        ("Height (in):", "height_entry", lambda self: ttk.Entry(self.main_frame, width=30)),
+        ("GSM:", "gsm_entry", lambda self: ttk.Entry(self.main_frame, width=30)),
+        ("Quantity:", "quantity_entry", lambda self: ttk.Entry(self.main_frame, width=30)),
+        ("Printing: (0 means no colors)", "printing_dropdown",
+         lambda self: ttk.Combobox(self.main_frame, textvariable=self.printing_var,
+                                   values=["0", "1", "2", "3", "4", "5", "6"], font=self._font_body)),
+    )
+
     def __init__(self):
         """
         Initializes the RawMaterialEstimatorGUI class.
@@ -109,6 +374,10 @@ class RawMaterialEstimatorGUI:
         self.style = ttk.Style()
         self.style.theme_use("clam")
 
+        # Shared fonts: every widget references the same Tk font instead of parsing its own spec
+        self._font_body = tkfont.Font(family="Arial", size=12)
+        self._font_head = tkfont.Font(family="Arial", size=14, weight="bold")
+
         self.main_frame = ttk.Frame(self.window, padding=20)
         self.main_frame.grid(row=0, column=0, sticky="nsew")
 
@@ -116,74 +385,41 @@ class RawMaterialEstimatorGUI:
         self.window.rowconfigure(0, weight=1)
         self.main_frame.columnconfigure(0, weight=1)
 
+        # Create the save and backup directories once, before the job number is looked up
+        os.makedirs(save_directory_env, exist_ok=True)
+        os.makedirs(backup_directory_env, exist_ok=True)
+
+        # Job number for the next BOM, computed lazily and advanced after every save
+        self._cached_job_number = None
+
+        # Prepare the BOM template once per session
+        self._template = BomTemplate(TEMPLATE_BYTES, self._BOM_CELLS + self._COLOR_CELLS)
+
+        # BOM files are written on a single worker thread so the window stays responsive;
+        # results come back through a queue that the Tk main thread polls
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._io_results = queue.Queue()
+
         # Display the job number at the top
-        self.job_number_label = ttk.Label(self.main_frame, text=f"Job Number: {self.generate_job_number()}", font=("Arial", 14, "bold"),
+        self.job_number_label = ttk.Label(self.main_frame, text=f"Job Number: {self.generate_job_number()}", font=self._font_head,
                                            foreground="red")
         self.job_number_label.grid(row=0, column=0, columnspan=2, pady=10)
 
-        # Customer Name entry field
-        ttk.Label(self.main_frame, text="Customer Name:", font=("Arial", 12)).grid(row=1, column=0, pady=5, sticky="w")
-        self.customer_name_entry = ttk.Entry(self.main_frame, width=45)
-        self.customer_name_entry.grid(row=1, column=1, padx=10)
-
-        # Customer Email entry field
-        ttk.Label(self.main_frame, text="Customer Email:", font=("Arial", 12)).grid(row=2, column=0, pady=5, sticky="w")
-        self.customer_email_entry = ttk.Entry(self.main_frame, width=45)
-        self.customer_email_entry.grid(row=2, column=1, padx=10)
-
-        # Job Name entry field
-        ttk.Label(self.main_frame, text="Job Name:", font=("Arial", 12)).grid(row=3, column=0, pady=5, sticky="w")
-        self.job_name_entry = ttk.Entry(self.main_frame, width=45)
-        self.job_name_entry.grid(row=3, column=1, padx=10)
-
-        # Customer Mobile entry field
-        ttk.Label(self.main_frame, text="Customer Mobile:", font=("Arial", 12)).grid(row=4, column=0, pady=5, sticky="w")
-        self.customer_mobile_entry = ttk.Entry(self.main_frame, width=30)
-        self.customer_mobile_entry.grid(row=4, column=1, padx=10)
-
-        # Job Type dropdown
-        ttk.Label(self.main_frame, text="Job Type:", font=("Arial", 12)).grid(row=5, column=0, pady=5, sticky="w")
-        self.job_type_combo = ttk.Combobox(self.main_frame, values=["SOS", "Carry Bag", "V-Bottom", "Thumb Cut", "Square Cut"], 
-                                           font=("Arial", 12))
-        self.job_type_combo.current(0)
-        self.job_type_combo.grid(row=5, column=1, padx=10)
-
-        # Width entry field
-        ttk.Label(self.main_frame, text="Width (in):", font=("Arial", 12)).grid(row=6, column=0, pady=5, sticky="w")
-        self.width_entry = ttk.Entry(self.main_frame, width=30)
-        self.width_entry.grid(row=6, column=1, padx=10)
-
-        # Bottom entry field
-        ttk.Label(self.main_frame, text="Bottom (in):", font=("Arial", 12)).grid(row=7, column=0, pady=5, sticky="w")
-        self.bottom_entry = ttk.Entry(self.main_frame, width=30)
-        self.bottom_entry.grid(row=7, column=1, padx=10)
-
-        # Height entry field
-        ttk.Label(self.main_frame, text="Height (in):", font=("Arial", 12)).grid(row=8, column=0, pady=5, sticky="w")
-        self.height_entry = ttk.Entry(self.main_frame, width=30)
-        self.height_entry.grid(row=8, column=1, padx=10)
-
-        # GSM entry field
-        ttk.Label(self.main_frame, text="GSM:", font=("Arial", 12)).grid(row=9, column=0, pady=5, sticky="w")
-        self.gsm_entry = ttk.Entry(self.main_frame, width=30)
-        self.gsm_entry.grid(row=9, column=1, padx=10)
-
-        # Quantity entry field
-        ttk.Label(self.main_frame, text="Quantity:", font=("Arial", 12)).grid(row=10, column=0, pady=5, sticky="w")
-        self.quantity_entry = ttk.Entry(self.main_frame, width=30)
-        self.quantity_entry.grid(row=10, column=1, padx=10)
-
-        # Printing dropdown
-        ttk.Label(self.main_frame, text="Printing: (0 means no colors)", font=("Arial", 12)).grid(row=11, column=0, pady=5, sticky="w")
+        # Label and input widget for every form row
         self.printing_var = tk.StringVar()
-        self.printing_dropdown = ttk.Combobox(self.main_frame, textvariable=self.printing_var, 
-                                              values=["0", "1", "2", "3", "4", "5", "6"], font=("Arial", 12))
+        for row, (text, attribute, create_widget) in enumerate(self._FORM, start=1):
+            ttk.Label(self.main_frame, text=text, font=self._font_body).grid(row=row, column=0, pady=5, sticky="w")
+            widget = create_widget(self)
+            widget.grid(row=row, column=1, padx=10)
+            setattr(self, attribute, widget)
+
+        # Dropdown defaults
+        self.job_type_combo.current(0)
         self.printing_dropdown.current(0)
-        self.printing_dropdown.grid(row=11, column=1, padx=10)
         self.printing_dropdown.bind("<<ComboboxSelected>>", self.dynamic_fields)
 
         # Line break between Color Details and Color 1, Color 2, Color 3
-        ttk.Label(self.main_frame, text="Color Details:", font=("Arial", 12)).grid(row=12, column=0, pady=5, sticky="e")
+        ttk.Label(self.main_frame, text="Color Details:", font=self._font_body).grid(row=12, column=0, pady=5, sticky="e")
         ttk.Label(self.main_frame, text="").grid(row=13, column=0)
 
         self.color_entries = []  # List to store color entry fields
@@ -199,28 +435,23 @@ class RawMaterialEstimatorGUI:
             event (Event): The event object triggered by the printing option selection.
 
         Comments:
-        - Destroys existing color entries and labels.
-        - Creates color labels and entries based on the selected printing option.
-        - Removes excess color fields if the printing option is reduced.
+        - Destroys only the color fields beyond the selected printing option.
+        - Creates only the color labels and entries that are missing.
         - Configures the submit button and adjusts the grid layout accordingly.
         - Updates the window to reflect the changes.
 
         """
 
-        # Destroy existing color entries and labels
-        for entry in self.color_entries:
-            entry.destroy()
-        self.color_entries.clear()
+        num_color_fields = int(self.printing_var.get())
 
-        for label in self.color_labels:
-            label.destroy()
-        self.color_labels.clear()
-
-        printing_value = int(self.printing_var.get())
+        # Remove excess color fields if the printing value is reduced
+        while len(self.color_entries) > num_color_fields:
+            self.color_entries.pop().destroy()
+            self.color_labels.pop().destroy()
 
-        # Create color labels and entries
-        for i in range(printing_value):
-            label = ttk.Label(self.main_frame, text=f"Color {i+1}:", font=("Arial", 12))
+        # Create the missing color labels and entries if the printing value is increased
+        for i in range(len(self.color_entries), num_color_fields):
+            label = ttk.Label(self.main_frame, text=f"Color {i+1}:", font=self._font_body)
             label.grid(row=i+13, column=0, pady=5, sticky="e")
             self.color_labels.append(label)
 
@@ -228,33 +459,22 @@ class RawMaterialEstimatorGUI:
             color_entry.grid(row=i+13, column=1, padx=10, sticky="w")
             self.color_entries.append(color_entry)
 
-        # Remove excess color fields if the printing value is reduced
-        num_color_fields = printing_value
-        if len(self.color_entries) > num_color_fields:
-            for i in range(num_color_fields, len(self.color_entries)):
-                self.color_entries[i].destroy()
-                self.color_labels[i].destroy()
-
-            self.color_entries = self.color_entries[:num_color_fields]
-            self.color_labels = self.color_labels[:num_color_fields]
-
         # Configure the submit button and grid layout
-        self.submit_button.grid(row=num_color_fields + 13, column=0, columnspan=2, pady=10, sticky="nsew")
         self.main_frame.grid_rowconfigure(num_color_fields + 14, weight=1)
         total_rows = num_color_fields + 15
         self.main_frame.grid_rowconfigure(total_rows, weight=1)
         self.main_frame.grid_columnconfigure(0, weight=1)
         self.submit_button.grid(row=total_rows, column=0, columnspan=2, pady=10, sticky="nsew")
 
-        # Update the window to reflect the changes
-        self.window.update()
+        # Redraw the window without re-entering the event loop
+        self.window.update_idletasks()
 
     def validate_fields(self):
         """
         Validate the input fields for job details.
 
         Returns:
-            bool: True if all fields are valid, False otherwise.
+            dict: The parsed job details if all fields are valid, None otherwise.
 
         Comments:
         - Validates the job name, customer name, email address, and mobile number.
@@ -267,67 +487,54 @@ class RawMaterialEstimatorGUI:
         job_name = self.job_name_entry.get().strip()
         if len(job_name) > 75:
             messagebox.showerror("Error", "Invalid job name. Please enter a valid name (up to 75 characters).")
-            return False
+            return None
 
         customer_name = self.customer_name_entry.get().strip()
         if not customer_name or len(customer_name) > 75:
             messagebox.showerror("Error", "Invalid customer name. Please enter a valid name (up to 75 characters).")
-            return False
+            return None
 
         customer_email = self.customer_email_entry.get().strip()
-        if not customer_email or not re.match(r"[^@]+@[^@]+\.[^@]+", customer_email):
+        if not customer_email or not _EMAIL_RE.match(customer_email):
             messagebox.showerror("Error", "Invalid email address. Please enter a valid email address.")
-            return False
+            return None
 
         customer_mobile = self.customer_mobile_entry.get().strip()
-        if not customer_mobile or not re.match(r"^(?:\+91|0)?[789]\d{9}$", customer_mobile):
+        if not customer_mobile or not _MOBILE_RE.match(customer_mobile):
             messagebox.showerror("Error", "Invalid mobile number. Please enter a valid 10-digit mobile number starting with 7, 8, or 9.")
-            return False
+            return None
+
+        parsed = {
+            "customer_name": customer_name,
+            "customer_email": customer_email,
+            "customer_mobile": customer_mobile,
+        }
+        for key, attribute, minimum, maximum, error_message in _FIELD_LIMITS:
+            try:
+                value = float(getattr(self, attribute).get())
+            except ValueError:
+                value = None
+            if value is None or not (minimum <= value <= maximum):
+                messagebox.showerror("Error", "Invalid job details. " + error_message)
+                return None
+            parsed[key] = value
 
         try:
-            width = float(self.width_entry.get())
-            if not (5.25 <= width <= 13.00):
-                raise ValueError("width")
-
-            bottom = float(self.bottom_entry.get())
-            if not (2.5 <= bottom <= 7.00):
-                raise ValueError("bottom")
-
-            height = float(self.height_entry.get())
-            if not (6.75 <= height <= 17.75):
-                raise ValueError("height")
-
-            gsm = float(self.gsm_entry.get())
-            if not (55 <= gsm <= 150):
-                raise ValueError("gsm")
-
             quantity = int(self.quantity_entry.get())
-            if quantity < 10000:
-                raise ValueError("quantity")
-
-        except ValueError as e:
-            error_message = "Invalid job details. "
-            if str(e) == "width":
-                error_message += "Please enter a valid width value within the range of 5.25 to 13.00."
-            elif str(e) == "bottom":
-                error_message += "Please enter a valid bottom value within the range of 2.5 to 7.00."
-            elif str(e) == "height":
-                error_message += "Please enter a valid height value within the range of 6.75 to 17.75."
-            elif str(e) == "gsm":
-                error_message += "Please enter a valid GSM value within the range of 55 to 150."
-            else:
-                error_message += "Please enter valid quantity within the range of >= 10000."
-
-            messagebox.showerror("Error", error_message)
-            return False
+        except ValueError:
+            quantity = None
+        if quantity is None or quantity < 10000:
+            messagebox.showerror("Error", "Invalid job details. Please enter valid quantity within the range of >= 10000.")
+            return None
 
         num_colors = int(self.printing_var.get())
         colors = [entry.get().strip() for entry in self.color_entries[:num_colors]]  # Only consider the relevant number of color entries
         if len(colors) != num_colors or any(not color for color in colors):
             messagebox.showerror("Error", "Invalid color details. Please enter a color for each selected printing option.")
-            return False
+            return None
 
-        return True
+        parsed.update(quantity=quantity, num_colors=num_colors, colors=colors)
+        return parsed
 
     def process_data(self):
         """
@@ -341,40 +548,34 @@ class RawMaterialEstimatorGUI:
             None
         """
         
-        if not self.validate_fields():
+        parsed = self.validate_fields()
+        if parsed is None:
             return
 
-        # Retrieve data from input fields
-        h_in = float(self.height_entry.get())
-        b_in = float(self.bottom_entry.get())
-        w_in = float(self.width_entry.get())
-        gsm = float(self.gsm_entry.get())
-        quantity = int(self.quantity_entry.get())
-        printing = self.printing_var.get()
-        colors = [entry.get().strip() for entry in self.color_entries]
+        # Use the values already parsed during validation
+        h_in = parsed["height"]
+        b_in = parsed["bottom"]
+        w_in = parsed["width"]
+        gsm = parsed["gsm"]
+        quantity = parsed["quantity"]
+        colors = parsed["colors"]
 
         # Calculate actual height in mm
-        act_height = h_in + (b_in / 2) + 1
-        act_height_mm = act_height * 25.4
+        act_height_mm = (h_in + b_in / 2 + 1) * _MM_PER_IN
 
         # Calculate actual width in mm
-        act_width_in = 2 * (w_in + b_in) + 1
-        act_width_mm = act_width_in * 25.4
+        act_width_mm = (2 * (w_in + b_in) + 1) * _MM_PER_IN
 
-        # Choose the closest available cylinder size
-        chosen_cylinder = min(AVAILABLE_CYLINDERS, key=lambda x: abs(x - act_height_mm))
+        # Choose the closest available cylinder size; only the neighbours of the insertion point can be closest
+        idx = bisect.bisect_left(AVAILABLE_CYLINDERS, act_height_mm)
+        chosen_cylinder = min(AVAILABLE_CYLINDERS[max(0, idx - 1):idx + 1], key=lambda x: abs(x - act_height_mm))
 
-        # Choose the immediately smaller and bigger available paper roll sizes
-        immediately_smaller_roll = max(
-            [x for x in AVAILABLE_PAPER_ROLLS if x <= act_width_mm]
-        )
-        immediately_bigger_roll = min(
-            [x for x in AVAILABLE_PAPER_ROLLS if x > act_width_mm]
-        )
-        if (act_width_mm - immediately_smaller_roll) <= 5:
-            chosen_paper_roll = immediately_smaller_roll
+        # Choose the immediately smaller (<=) or bigger (>) available paper roll size
+        idx = bisect.bisect_right(AVAILABLE_PAPER_ROLLS, act_width_mm)
+        if idx > 0 and (act_width_mm - AVAILABLE_PAPER_ROLLS[idx - 1]) <= 5:
+            chosen_paper_roll = AVAILABLE_PAPER_ROLLS[idx - 1]
         else:
-            chosen_paper_roll = immediately_bigger_roll
+            chosen_paper_roll = AVAILABLE_PAPER_ROLLS[idx]
 
         # Calculate various values
         mm_to_m = 0.001
@@ -386,115 +587,162 @@ class RawMaterialEstimatorGUI:
         ink = 0.01 * wpb * quantity / 1000
 
         # Get the current date and time
-        current_date = datetime.datetime.now().strftime("%d/%m/%Y")
-        current_time = datetime.datetime.now().strftime("%H:%M:%S")
-
-        # Load the Excel template
-        template_path = resource_path(temp_path_env)  
-        wb = openpyxl.load_workbook(template_path)
-        sheet = wb["Sheet1"]
-
-        # Update the template with the entered data
-        sheet["B8"].value = self.generate_job_number()
-        sheet["B11"].value = self.customer_name_entry.get()
-        sheet["H11"].value = self.customer_email_entry.get()
-        sheet["B12"].value = self.customer_mobile_entry.get()
-        sheet["B14"].value = self.job_type_combo.get()
-        sheet["D15"].value = round(w_in, 2)
-        sheet["F15"].value = round(b_in, 2)
-        sheet["H15"].value = round(h_in, 2)
-        sheet["J15"].value = gsm
-        sheet["L15"].value = quantity
-        sheet["F8"].value = current_date
-        sheet["J8"].value = current_time
-        if printing == 0:
-            sheet["B16"].value = "No"
-        else:
-            sheet["B16"].value = "Yes"
-        for i, color in enumerate(colors):
-            sheet.cell(row=16, column=4 + i * 2).value = color
-
-        # Update the calculated values
-        sheet["E19"].value = round(act_height_mm, 2)
-        sheet["E20"].value = chosen_cylinder
-        sheet["E21"].value = chosen_paper_roll
-        sheet["E22"].value = round(wpb, 2)
-        sheet["E23"].value = round(total_finish_weight, 2)
-        sheet["E24"].value = round(total_weight, 2)
-        sheet["E25"].value = round(side_glue, 2)
-        sheet["E26"].value = round(bottom_glue, 2)
-        sheet["E27"].value = round(ink, 2)
+        now = datetime.datetime.now()
+        current_date = now.strftime("%d/%m/%Y")
+        current_time = now.strftime("%H:%M:%S")
+
+        job_number = self.generate_job_number()
+
+        # Fill the template with the entered data and the calculated values
+        values = (
+            job_number, current_date, current_time,
+            parsed["customer_name"], parsed["customer_email"],
+            parsed["customer_mobile"], self.job_type_combo.get(),
+            round(w_in, 2), round(b_in, 2), round(h_in, 2), gsm, quantity,
+            "No" if parsed["num_colors"] == 0 else "Yes",
+            round(act_height_mm, 2), chosen_cylinder, chosen_paper_roll,
+            round(wpb, 2), round(total_finish_weight, 2), round(total_weight, 2),
+            round(side_glue, 2), round(bottom_glue, 2), round(ink, 2),
+        )
+        cells = dict(zip(self._BOM_CELLS, values))
+        cells.update(zip(self._COLOR_CELLS, colors))
 
         # Generate a new filename for the bill of material
-        new_filename = f"{self.generate_job_number()}.xlsx"
-        save_directory = save_directory_env
-        backup_directory = backup_directory_env
+        new_filename = f"{job_number}.xlsx"
+
+        # Define the save and backup paths (the directories are created in __init__)
+        save_path = f"{save_directory_env}{os.sep}{new_filename}"
+        backup_path = f"{backup_directory_env}{os.sep}{new_filename}"
 
-        # Create the directories if they don't exist
-        if not os.path.exists(save_directory):
-            os.makedirs(save_directory)
+        # Save the filled template as a new bill of material on the worker thread;
+        # submitting is disabled until the result is back
+        self.submit_button.state(["disabled"])
+        self._io_pool.submit(self._write_bom, job_number, cells, save_path, backup_path)
+        self.window.after(50, self._poll_queue)
 
-        if not os.path.exists(backup_directory):
-            os.makedirs(backup_directory)
+    def _write_bom(self, job_number, cells, save_path, backup_path):
+        """
+        Save a bill of material and its backup. Runs on the worker thread.
 
-        # Define the save and backup paths
-        save_path = os.path.join(save_directory, new_filename)
-        backup_path = os.path.join(backup_directory, new_filename)
+        Args:
+            job_number (str): Job number of the BOM.
+            cells (dict): Template cell references and their values.
+            save_path (str): Path of the bill of material.
+            backup_path (str): Path of the backup copy.
+
+        Comments:
+        - Must not touch any widget; the outcome is put on the results queue for _poll_queue.
+        """
+        try:
+            self._template.write(save_path, cells)
+            _fast_copy(save_path, backup_path)
+            _write_job_counter(job_number)
+        except Exception as e:
+            self._io_results.put((job_number, save_path, e))
+        else:
+            self._io_results.put((job_number, save_path, None))
 
-        # Save the modified template as a new bill of material
-        wb.save(save_path)
-        shutil.copyfile(save_path, backup_path)
-        self.handle_fields()
+    def _poll_queue(self):
+        """
+        Handle the outcome of a BOM write on the Tk main thread.
+
+        Comments:
+        - Checks the results queue again after 50 ms while the worker is still busy.
+        - On success, advances the job number, resets the fields and shows a success message.
+        - On failure, keeps the entered data so the job can be resubmitted and shows the error.
+        """
+        try:
+            job_number, save_path, error = self._io_results.get_nowait()
+        except queue.Empty:
+            self.window.after(50, self._poll_queue)
+            return
+
+        self.submit_button.state(["!disabled"])
+        if error is not None:
+            messagebox.showerror("Error", f"Could not save {save_path}: {error}")
+            return
+
+        # Advance the cached job number instead of rescanning the backup directory
+        self._cached_job_number = next_job_number(job_number)
+
+        self.handle_fields(self._cached_job_number)
         # Display a success message
         messagebox.showinfo("Success", f"Data saved to {save_path}")
 
     def generate_job_number(self):
         """
-        Generate a unique job number based on the fiscal year and sequential number.
+        Return the job number for the next bill of material.
 
         Returns:
-            str: The generated job number.
+            str: The job number.
 
         Comments:
-        - Determines the current date and year.
-        - Calculates the fiscal year based on the Indian fiscal cycle.
-        - Retrieves the list of files in a directory.
-        - Determines the latest job number file based on creation time.
-        - Extracts the year and number from the file name.
-        - Increments the sequential number if the file year matches the financial year; otherwise, sets it to 1.
-        - Constructs the job number in the format: {financial_year}_{sequential_number}.
+        - Computes the job number only on the first call; the result is cached
+          and advanced by _poll_queue after each successful save.
+        - Recomputes the cached value once the financial year has rolled over, so the
+          first job on or after 1 April never gets the previous year's number.
         """
 
-        current_date = datetime.date.today()
-        current_year = current_date.year
+        current_prefix = f"{financial_year(datetime.date.today())}_"
+        if self._cached_job_number is None or not self._cached_job_number.startswith(current_prefix):
+            self._cached_job_number = self._compute_job_number()
+        return self._cached_job_number
 
-        if current_date.month >= 4:  # April or later
-            financial_year = f"{str(current_year)[-2:]}-{str(current_year + 1)[-2:]}"
-        else:
-            financial_year = f"{(current_year - 1)[-2:]}-{str(current_year)[-2:]}"
+    def _compute_job_number(self):
+        """
+        Generate a unique job number based on the fiscal year and sequential number.
 
-        files = glob.glob("C:/Backup/*.xlsx")
-        latest_job_number_file = max(files, key=os.path.getctime) if files else None
+        Returns:
+            str: The generated job number.
 
-        if latest_job_number_file:
-            file_name = os.path.splitext(os.path.basename(latest_job_number_file))[0]
-            file_year, file_number = file_name.split("_")
+        Comments:
+        - Calculates the current fiscal year based on the Indian fiscal cycle.
+        - Reads the last issued job number from the counter file in the backup directory.
+        - Without a counter file, falls back to the latest backup file based on creation time.
+        - Extracts the year and number from the last job number.
+        - Increments the sequential number if the file year matches the financial year; otherwise, sets it to 1.
+        - Constructs the job number in the format: {financial_year}_{sequential_number}.
+        """
 
-            if file_year == financial_year:
+        current_financial_year = financial_year(datetime.date.today())
+
+        last_job_number = _read_job_counter()
+        if last_job_number is None:
+            # No counter yet (e.g. first run after upgrading): find the newest backup in a single
+            # pass over the directory; DirEntry.stat() avoids a second stat per file
+            latest_ctime = None
+            try:
+                with os.scandir(backup_directory_env) as entries:
+                    for entry in entries:
+                        if not entry.name.lower().endswith(".xlsx") or not entry.is_file():
+                            continue
+                        ctime = entry.stat().st_ctime
+                        if latest_ctime is None or ctime > latest_ctime:
+                            last_job_number, latest_ctime = os.path.splitext(entry.name)[0], ctime
+            except FileNotFoundError:
+                pass
+
+        if last_job_number:
+            file_year, file_number = last_job_number.split("_")
+
+            if file_year == current_financial_year:
                 sequential_number = str(int(file_number) + 1).zfill(7)
             else:
                 sequential_number = "0000001"
         else:
             sequential_number = "0000001"
 
-        job_number = f"{financial_year}_{sequential_number}"
+        job_number = f"{current_financial_year}_{sequential_number}"
         return job_number
 
 
-    def handle_fields(self):
+    def handle_fields(self, next_job_no=None):
         """
         Reset the input fields to their default state and update the job number in the GUI.
 
+        Args:
+            next_job_no (str, optional): Job number to display; looked up with generate_job_number() if omitted.
+
         Comments:
         - Clears the input fields for job details.
         - Resets the job type combo box selection and printing options.
@@ -526,7 +774,9 @@ class RawMaterialEstimatorGUI:
         self.color_entries.clear()
 
         # Update Job Number in GUI
-        self.job_number_label.config(text=f"Job Number: {self.generate_job_number()}")
+        if next_job_no is None:
+            next_job_no = self.generate_job_number()
+        self.job_number_label.config(text=f"Job Number: {next_job_no}")
 
 
     def run(self):